@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
@@ -29,8 +30,10 @@ def main() -> None:
 
     cache_missing = not paths.phase0_market_prices_path.exists() or not paths.phase0_benchmark_path.exists()
     if args.refresh_data or cache_missing:
-        prices = fetch_phase0_prices(labels, args.start_date, end_date)
-        benchmark = fetch_csi300(args.start_date, end_date)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            prices_future = pool.submit(fetch_phase0_prices, labels, args.start_date, end_date)
+            benchmark_future = pool.submit(fetch_csi300, args.start_date, end_date)
+            prices, benchmark = prices_future.result(), benchmark_future.result()
         prices.to_parquet(paths.phase0_market_prices_path, index=False)
         benchmark.to_parquet(paths.phase0_benchmark_path, index=False)
     else:
@@ -179,7 +179,9 @@ def _index(args: argparse.Namespace, paths: Paths) -> int:
     store, lexical_index, vector_index = _runtime(paths, args.db)
     if args.index_command == "migrate-markdown":
         docs_dir = Path(args.docs_dir).resolve() if args.docs_dir else paths.docs_dir
-        _print_json(migrate_markdown_documents(store, docs_dir, project_root=paths.project_root))
+        _print_json(migrate_markdown_documents(
+            store, docs_dir, project_root=paths.project_root, files=args.files or None,
+        ))
         return 0
     if args.index_command == "sync":
         lexical_reconciliation = lexical_index.reconcile(store)
@@ -246,6 +248,7 @@ def build_parser() -> argparse.ArgumentParser:
     index_subparsers = index.add_subparsers(dest="index_command", required=True)
     migrate = index_subparsers.add_parser("migrate-markdown", help="Idempotently migrate data/docs Markdown")
     migrate.add_argument("--docs-dir")
+    migrate.add_argument("files", nargs="*", help="Changed Markdown files to publish instead of rescanning --docs-dir")
     migrate.add_argument("--db")
     sync = index_subparsers.add_parser("sync", help="Consume pending jobs into lexical and vector indexes")
     sync.add_argument("--max-jobs", type=int, default=100_000)
@@ -38,9 +38,13 @@ def main() -> None:
     if not db_path.is_absolute():
         db_path = paths.project_root / db_path
     warehouse = PhaseWarehouse(db_path)
-    labels = pd.read_csv(paths.leader_cases_path, dtype={"ticker": str})
+    labels = pd.read_csv(paths.leader_cases_path, usecols=["ticker"], dtype={"ticker": str})
     symbols = tuple(sorted(set(labels["ticker"]).union({"000300.SH"})))
-    as_of = date.fromisoformat(args.as_of) if args.as_of else pd.read_parquet(paths.phase0_market_prices_path)["date"].max().date()
+    as_of = (
+        date.fromisoformat(args.as_of)
+        if args.as_of
+        else pd.read_parquet(paths.phase0_market_prices_path, columns=["date"])["date"].max().date()
+    )
     market_watermark = warehouse.watermark("cn_daily")
     market_start = max(
         date.fromisoformat(args.start_date),
@@ -5,6 +5,18 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+def _discover_project_root(cwd: Path) -> Path:
+    """Nearest ancestor of ``cwd`` holding this project, else the installed package's root."""
+    return next(
+        (
+            candidate
+            for candidate in (cwd, *cwd.parents)
+            if (candidate / "pyproject.toml").is_file() and (candidate / "src" / "quant_agent").is_dir()
+        ),
+        Path(__file__).resolve().parents[2],
+    )
+
+
 @dataclass(frozen=True)
 class Paths:
     project_root: Path | None = None
@@ -15,15 +27,7 @@ class Paths:
             if env_root:
                 root = Path(env_root).expanduser().resolve()
             else:
-                root = next(
-                    (
-                        candidate
-                        for candidate in (Path.cwd().resolve(), *Path.cwd().resolve().parents)
-                        if (candidate / "pyproject.toml").is_file()
-                        and (candidate / "src" / "quant_agent").is_dir()
-                    ),
-                    Path(__file__).resolve().parents[2],
-                )
+                root = _discover_project_root(Path.cwd().resolve())
             object.__setattr__(self, "project_root", root)
 
     @property
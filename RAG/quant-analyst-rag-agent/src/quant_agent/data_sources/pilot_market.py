@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -37,18 +36,23 @@ class PilotParquetMarketSource:
         if missing:
             raise SchemaValidationError(f"pilot market cache missing columns: {sorted(missing)}")
         combined["date"] = pd.to_datetime(combined["date"])
-        mask = (
-            combined["ticker"].isin(request.symbols)
-            & (combined["date"].dt.date >= request.start_date)
-            & (combined["date"].dt.date <= request.end_date)
+        # Compare on the wall-clock session date, as .dt.date would for tz-aware caches.
+        days = combined["date"]
+        if days.dt.tz is not None:
+            days = days.dt.tz_localize(None)
+        combined["session_day"] = days.dt.normalize()
+        mask = combined["ticker"].isin(request.symbols) & combined["session_day"].between(
+            pd.Timestamp(request.start_date), pd.Timestamp(request.end_date)
         )
+        selected = combined.loc[mask].sort_values(["ticker", "date"])
+        event_times = [day.to_pydatetime() for day in selected["session_day"].dt.tz_localize(SHANGHAI)]
+        trade_dates = selected["session_day"].dt.strftime("%Y-%m-%d").tolist()
         records: list[SourceRecord] = []
-        for row in combined.loc[mask].sort_values(["ticker", "date"]).itertuples(index=False):
-            event_time = datetime.combine(row.date.date(), datetime.min.time(), tzinfo=SHANGHAI)
+        for row, event_time, trade_date in zip(selected.itertuples(index=False), event_times, trade_dates):
             payload = {
                 "ticker": row.ticker,
                 "name": row.stock_name,
-                "trade_date": row.date.date().isoformat(),
+                "trade_date": trade_date,
                 "open": float(row.open),
                 "high": float(row.high),
                 "low": float(row.low),
@@ -1,30 +1,43 @@
 from __future__ import annotations
 
+import re
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
+from operator import attrgetter
 
 import pandas as pd
 
 
+SINA_SPOT_COLUMN_MAP = {
+    "代码": "source_symbol",
+    "名称": "name",
+    "最新价": "close",
+    "昨收": "prev_close",
+    "今开": "open",
+    "最高": "high",
+    "最低": "low",
+    "成交量": "volume",
+    "成交额": "amount",
+    "时间戳": "source_timestamp",
+}
+_SINA_NUMERIC_COLUMNS = ("close", "prev_close", "open", "high", "low", "volume", "amount")
+_SINA_SYMBOL = re.compile(r"(sh|sz)(\d{6})")
+_SINA_EXCHANGE = {"sh": "SH", "sz": "SZ"}
+_ST_NAME = re.compile(r"(?:^|\*)ST", re.IGNORECASE)
+
+
 def normalize_sina_spot(raw: pd.DataFrame, as_of: date) -> pd.DataFrame:
     """Normalize Sina's all-A-share snapshot without inventing historical fields."""
-    required = {"代码", "名称", "最新价", "昨收", "今开", "最高", "最低", "成交量", "成交额", "时间戳"}
-    missing = required - set(raw.columns)
+    missing = SINA_SPOT_COLUMN_MAP.keys() - set(raw.columns)
     if missing:
         raise ValueError(f"Sina spot missing columns: {sorted(missing)}")
-    frame = raw.rename(
-        columns={
-            "代码": "source_symbol", "名称": "name", "最新价": "close", "昨收": "prev_close",
-            "今开": "open", "最高": "high", "最低": "low", "成交量": "volume",
-            "成交额": "amount", "时间戳": "source_timestamp",
-        }
-    ).copy()
-    frame = frame.loc[frame["source_symbol"].str.match(r"^(sh|sz)\d{6}$", na=False)].copy()
-    suffix = frame["source_symbol"].str[:2].map({"sh": "SH", "sz": "SZ"})
-    frame["ticker"] = frame["source_symbol"].str[2:] + "." + suffix
-    numeric = ["close", "prev_close", "open", "high", "low", "volume", "amount"]
-    for column in numeric:
+    frame = raw.rename(columns=SINA_SPOT_COLUMN_MAP).copy()
+    # Boolean arrays select positionally, so duplicate raw index labels are harmless.
+    frame = frame.loc[frame["source_symbol"].str.fullmatch(_SINA_SYMBOL, na=False).to_numpy(dtype=bool)].copy()
+    symbols = frame["source_symbol"]
+    frame["ticker"] = symbols.str[2:] + "." + symbols.str[:2].map(_SINA_EXCHANGE)
+    for column in _SINA_NUMERIC_COLUMNS:
         frame[column] = pd.to_numeric(frame[column], errors="coerce")
     frame["date"] = pd.Timestamp(as_of)
     frame["return_1d"] = frame["close"] / frame["prev_close"] - 1
@@ -32,8 +45,9 @@ def normalize_sina_spot(raw: pd.DataFrame, as_of: date) -> pd.DataFrame:
     frame["intraday_close_location"] = ((frame["close"] - frame["low"]) / spread).where(spread > 0, 0.5)
     frame["close_vs_open"] = frame["close"] / frame["open"] - 1
     frame["amount_rank_market"] = frame["amount"].rank(method="min", ascending=False)
-    frame["is_st"] = frame["name"].astype(str).str.upper().str.contains(r"(?:^|\*)ST", regex=True)
-    frame["is_new_listing_name"] = frame["name"].astype(str).str.startswith(("N", "C"))
+    names = frame["name"].astype(str)
+    frame["is_st"] = names.str.contains(_ST_NAME)
+    frame["is_new_listing_name"] = names.str.startswith(("N", "C"))
     return frame.sort_values("ticker").reset_index(drop=True)
 
 
@@ -89,10 +103,16 @@ def fetch_sina_histories(
 
     start = (as_of - timedelta(days=lookback_days)).strftime("%Y%m%d")
     end = as_of.strftime("%Y%m%d")
+    spot_bar = attrgetter("open", "high", "low", "close", "volume", "amount")
 
     def fetch_one(row: object) -> tuple[pd.DataFrame | None, dict[str, str] | None]:
         source_symbol = str(getattr(row, "source_symbol"))
         ticker = str(getattr(row, "ticker"))
+        try:
+            name = str(getattr(row, "name"))
+            amount_rank_market = float(getattr(row, "amount_rank_market"))
+        except Exception as exc:  # a malformed candidate must not abort the pool
+            return None, {"ticker": ticker, "error_type": type(exc).__name__}
         last_error: Exception | None = None
         for attempt in range(retries + 1):
             try:
@@ -105,17 +125,15 @@ def fetch_sina_histories(
                 history["turnover_rate"] = 0.0
                 history["date"] = pd.to_datetime(history["date"])
                 history["ticker"] = ticker
-                history["name"] = str(getattr(row, "name"))
-                history["amount_rank_market"] = float(getattr(row, "amount_rank_market"))
+                history["name"] = name
+                history["amount_rank_market"] = amount_rank_market
                 if history["date"].max().date() < as_of:
+                    open_, high, low, close, volume, amount = (float(value) for value in spot_bar(row))
                     today = pd.DataFrame(
                         [{
-                            "date": pd.Timestamp(as_of), "open": float(getattr(row, "open")),
-                            "high": float(getattr(row, "high")), "low": float(getattr(row, "low")),
-                            "close": float(getattr(row, "close")), "volume": float(getattr(row, "volume")),
-                            "amount": float(getattr(row, "amount")), "turnover_rate": 0.0,
-                            "ticker": ticker, "name": str(getattr(row, "name")),
-                            "amount_rank_market": float(getattr(row, "amount_rank_market")),
+                            "date": pd.Timestamp(as_of), "open": open_, "high": high, "low": low,
+                            "close": close, "volume": volume, "amount": amount, "turnover_rate": 0.0,
+                            "ticker": ticker, "name": name, "amount_rank_market": amount_rank_market,
                         }]
                     )
                     history = pd.concat([history, today], ignore_index=True, sort=False)
@@ -12,6 +12,7 @@ FACTOR_ALIASES = {"momentum": "momentum_60d", "60-day momentum": "momentum_60d",
 REGIME_ALIASES = {"high volatility": "high_volatility", "high-volatility": "high_volatility", "high_volatility": "high_volatility", "low volatility": "low_volatility", "low-volatility": "low_volatility", "low_volatility": "low_volatility", "drawdown": "drawdown", "recovery": "recovery", "bull trend": "bull_trend", "bull-trend": "bull_trend", "bull_trend": "bull_trend"}
 STRATEGY_ALIASES = {"momentum": "momentum_long_short", "momentum strategy": "momentum_long_short", "momentum_long_short": "momentum_long_short", "volatility": "low_volatility_strategy", "low volatility": "low_volatility_strategy", "low_volatility_strategy": "low_volatility_strategy", "liquidity": "liquidity_quality_strategy", "liquidity_quality_strategy": "liquidity_quality_strategy", "sector rotation": "sector_rotation_strategy", "sector-rotation": "sector_rotation_strategy", "sector_rotation_strategy": "sector_rotation_strategy"}
 ALLOWED_METRICS = {"annual_return", "sharpe", "max_drawdown", "volatility", "turnover", "transaction_cost_bps", "benchmark_return", "hit_rate"}
+_YEAR = re.compile(r"\b(20\d{2})\b")
 
 
 def normalize_date(value: str | None) -> str | None:
@@ -43,7 +44,7 @@ def normalize_strategy_name(value: str | None) -> str | None:
 
 
 def extract_year_range(query: str) -> tuple[str | None, str | None]:
-    years = [int(match) for match in re.findall(r"\b(20\d{2})\b", query)]
+    years = [int(match) for match in _YEAR.findall(query)]
     if not years:
         return None, None
     if len(years) == 1:
@@ -3,6 +3,7 @@ import re
 from typing import Any
 from quant_agent.config import Paths
 from quant_agent.graph.workflow import ask
+_METRIC_CLAIM = re.compile(r"(?:Sharpe|max drawdown|turnover|annual return|return)[: ]+(-?\d+(?:\.\d+)?)%?", re.I)
 TEST_QUERIES = ["Which factor performed best during high-volatility regimes?", "What caused the momentum strategy to underperform in March 2020?", "Explain how the liquidity anomaly factor is calculated."]
 def has_required_evidence(result: dict[str, Any]) -> bool:
     route = result.get("route")
@@ -11,7 +12,7 @@ def has_required_evidence(result: dict[str, Any]) -> bool:
     if route == "hybrid_sql_retrieval": return bool(result.get("retrieved_docs")) and bool(result.get("sql_results"))
     return "I do not have enough" in result.get("answer", "")
 def numeric_claims_are_grounded(result: dict[str, Any]) -> bool:
-    answer = result.get("answer", ""); metric_like = re.findall(r"(?:Sharpe|max drawdown|turnover|annual return|return)[: ]+(-?\d+(?:\.\d+)?)%?", answer, flags=re.I)
+    answer = result.get("answer", ""); metric_like = _METRIC_CLAIM.findall(answer)
     if not metric_like: return True
     numeric_values = []
     for row in result.get("sql_results", []):
@@ -85,14 +85,17 @@ def run_canonical_retrieval_eval(
             top_k=case.top_k,
         ))
         returned = tuple(evidence.document_id for evidence in response.evidence)
+        unique_relevant = set(case.relevant_document_ids)
+        case_tickers = set(case.tickers)
+        case_themes = set(case.themes)
+        forbidden = set(case.forbidden_document_ids)
         seen_relevant: set[str] = set()
         relevant_ranks_list: list[int] = []
         for index, document_id in enumerate(returned):
-            if document_id in case.relevant_document_ids and document_id not in seen_relevant:
+            if document_id in unique_relevant and document_id not in seen_relevant:
                 relevant_ranks_list.append(index + 1)
                 seen_relevant.add(document_id)
         relevant_ranks = tuple(relevant_ranks_list)
-        unique_relevant = set(case.relevant_document_ids)
         recall = (
             1.0
             if case.expect_no_results and not returned
@@ -108,16 +111,16 @@ def run_canonical_retrieval_eval(
             if metadata is None:
                 filter_violations += 1
                 continue
-            if case.tickers and not set(case.tickers) & metadata["tickers"]:
+            if case_tickers and not case_tickers & metadata["tickers"]:
                 filter_violations += 1
-            if case.themes and not set(case.themes) & metadata["themes"]:
+            if case_themes and not case_themes & metadata["themes"]:
                 filter_violations += 1
             if case.document_types and metadata["document_type"] not in case.document_types:
                 filter_violations += 1
             if metadata["status"] not in case.statuses:
                 filter_violations += 1
         forbidden_hits = sum(
-            document_id in case.forbidden_document_ids for document_id in returned
+            document_id in forbidden for document_id in returned
         )
         reasons: list[str] = []
         if case.expect_no_results and returned:
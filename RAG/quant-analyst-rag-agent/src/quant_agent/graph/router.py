@@ -12,24 +12,30 @@ QUERY_TYPE_TO_ROUTE = {
     "calculation_query": "calculator",
     "ambiguous_query": "clarification_or_safe_response",
 }
+_FACTOR_DEFINITION = re.compile(r"\b(formula|definition|defined|calculated|how is .* calculated|how .* calculate)\b")
+_HYBRID_EXPLANATION = re.compile(r"\b(why|caused|cause|underperform|underperformed|explain what happened)\b")
+_RESEARCH_NOTE = re.compile(r"\b(research notes|find notes|notes related|related to|documents?)\b")
+_REGIME_ANALYSIS = re.compile(r"\b(regime|high[- ]volatility|low[- ]volatility|recovery|drawdown|bull[- ]trend)\b")
+_STRUCTURED_METRIC = re.compile(r"\b(sharpe|max drawdown|turnover|annual return|best strategy|best factor|metrics?)\b")
+_CALCULATION = re.compile(r"\b(calculate|difference|spread)\b")
 
 
 def classify_query(query: str) -> str:
     q = query.lower()
 
-    if re.search(r"\b(formula|definition|defined|calculated|how is .* calculated|how .* calculate)\b", q):
+    if _FACTOR_DEFINITION.search(q):
         return "factor_definition_query"
-    if re.search(r"\b(why|caused|cause|underperform|underperformed|explain what happened)\b", q):
+    if _HYBRID_EXPLANATION.search(q):
         return "hybrid_explanation_query"
-    if re.search(r"\b(research notes|find notes|notes related|related to|documents?)\b", q):
+    if _RESEARCH_NOTE.search(q):
         return "research_note_query"
-    if re.search(r"\b(regime|high[- ]volatility|low[- ]volatility|recovery|drawdown|bull[- ]trend)\b", q):
+    if _REGIME_ANALYSIS.search(q):
         return "regime_analysis_query"
     if "compare" in q:
         return "backtest_comparison_query"
-    if re.search(r"\b(sharpe|max drawdown|turnover|annual return|best strategy|best factor|metrics?)\b", q):
+    if _STRUCTURED_METRIC.search(q):
         return "structured_metric_query"
-    if re.search(r"\b(calculate|difference|spread)\b", q):
+    if _CALCULATION.search(q):
         return "calculation_query"
 
     return "ambiguous_query"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any
 
 import pandas as pd
 
@@ -65,62 +67,79 @@ def _year_chunks(start_date: str, end_date: str) -> list[tuple[pd.Timestamp, pd.
     return chunks
 
 
-def fetch_phase0_prices(labels: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+def _fetch_one_stock(ak: Any, ticker: str, stock_name: str, start_date: str, end_date: str) -> pd.DataFrame:
+    code, exchange = ticker.split(".", maxsplit=1)
+    if exchange not in {"SH", "SZ"}:
+        raise ValueError(f"Phase 0 Sina adapter does not support exchange: {exchange}")
+    try:
+        raw = _retry(
+            lambda: ak.stock_zh_a_daily(
+                symbol=f"{exchange.lower()}{code}",
+                start_date=_yyyymmdd(start_date),
+                end_date=_yyyymmdd(end_date),
+                adjust="qfq",
+            )
+        )
+        normalized = raw.copy()
+        required = {"date", "open", "high", "low", "close", "volume", "amount", "turnover"}
+        missing = required - set(normalized.columns)
+        if missing:
+            raise ValueError(f"AkShare Sina response for {ticker} is missing: {sorted(missing)}")
+        normalized["turnover_rate"] = pd.to_numeric(normalized["turnover"], errors="raise")
+        normalized["data_source"] = "akshare.stock_zh_a_daily"
+        normalized["adjustment"] = "qfq_sina_current"
+    except RuntimeError:
+        raw_chunks = []
+        for chunk_start, chunk_end in _year_chunks(start_date, end_date):
+            raw_chunks.append(
+                _retry(
+                    lambda chunk_start=chunk_start, chunk_end=chunk_end: ak.stock_zh_a_hist(
+                        symbol=code,
+                        period="daily",
+                        start_date=_yyyymmdd(chunk_start),
+                        end_date=_yyyymmdd(chunk_end),
+                        adjust="qfq",
+                        timeout=20,
+                    )
+                )
+            )
+        raw = pd.concat(raw_chunks, ignore_index=True).drop_duplicates("日期", keep="last")
+        normalized = raw.rename(columns=PRICE_COLUMN_MAP)
+        missing = set(PRICE_COLUMN_MAP.values()) - set(normalized.columns)
+        if missing:
+            raise ValueError(f"AkShare Eastmoney response for {ticker} is missing: {sorted(missing)}")
+        normalized["turnover_rate"] = pd.to_numeric(normalized["turnover_rate_pct"], errors="raise") / 100
+        normalized["data_source"] = "akshare.stock_zh_a_hist"
+        normalized["adjustment"] = "qfq_eastmoney_current"
+
+    normalized["ticker"] = ticker
+    normalized["stock_name"] = stock_name
+    return normalized
+
+
+def fetch_phase0_prices(labels: pd.DataFrame, start_date: str, end_date: str, workers: int = 4) -> pd.DataFrame:
+    """Download the labelled stocks' daily bars, ``workers`` stocks at a time.
+
+    The first failed stock cancels downloads that have not started yet and is re-raised.
+    """
     try:
         import akshare as ak
     except ImportError as exc:  # pragma: no cover - depends on optional environment
         raise RuntimeError('Install research dependencies with: pip install -e ".[research]"') from exc
 
-    frames: list[pd.DataFrame] = []
     stocks = labels[["ticker", "name"]].drop_duplicates().sort_values("ticker")
-    for stock in stocks.itertuples(index=False):
-        code, exchange = stock.ticker.split(".", maxsplit=1)
-        if exchange not in {"SH", "SZ"}:
-            raise ValueError(f"Phase 0 Sina adapter does not support exchange: {exchange}")
-        try:
-            raw = _retry(
-                lambda code=code, exchange=exchange: ak.stock_zh_a_daily(
-                    symbol=f"{exchange.lower()}{code}",
-                    start_date=_yyyymmdd(start_date),
-                    end_date=_yyyymmdd(end_date),
-                    adjust="qfq",
-                )
-            )
-            normalized = raw.copy()
-            required = {"date", "open", "high", "low", "close", "volume", "amount", "turnover"}
-            missing = required - set(normalized.columns)
-            if missing:
-                raise ValueError(f"AkShare Sina response for {stock.ticker} is missing: {sorted(missing)}")
-            normalized["turnover_rate"] = pd.to_numeric(normalized["turnover"], errors="raise")
-            normalized["data_source"] = "akshare.stock_zh_a_daily"
-            normalized["adjustment"] = "qfq_sina_current"
-        except RuntimeError:
-            raw_chunks = []
-            for chunk_start, chunk_end in _year_chunks(start_date, end_date):
-                raw_chunks.append(
-                    _retry(
-                        lambda code=code, chunk_start=chunk_start, chunk_end=chunk_end: ak.stock_zh_a_hist(
-                            symbol=code,
-                            period="daily",
-                            start_date=_yyyymmdd(chunk_start),
-                            end_date=_yyyymmdd(chunk_end),
-                            adjust="qfq",
-                            timeout=20,
-                        )
-                    )
-                )
-            raw = pd.concat(raw_chunks, ignore_index=True).drop_duplicates("日期", keep="last")
-            normalized = raw.rename(columns=PRICE_COLUMN_MAP)
-            missing = set(PRICE_COLUMN_MAP.values()) - set(normalized.columns)
-            if missing:
-                raise ValueError(f"AkShare Eastmoney response for {stock.ticker} is missing: {sorted(missing)}")
-            normalized["turnover_rate"] = pd.to_numeric(normalized["turnover_rate_pct"], errors="raise") / 100
-            normalized["data_source"] = "akshare.stock_zh_a_hist"
-            normalized["adjustment"] = "qfq_eastmoney_current"
-
-        normalized["ticker"] = stock.ticker
-        normalized["stock_name"] = stock.name
-        frames.append(normalized)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(_fetch_one_stock, ak, stock.ticker, stock.name, start_date, end_date)
+            for stock in stocks.itertuples(index=False)
+        ]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        failed = next((future for future in futures if future in done and future.exception() is not None), None)
+        if failed is not None:
+            for future in pending:
+                future.cancel()
+            raise failed.exception()
+        frames = [future.result() for future in futures]
 
     prices = pd.concat(frames, ignore_index=True)
     prices["date"] = pd.to_datetime(prices["date"])
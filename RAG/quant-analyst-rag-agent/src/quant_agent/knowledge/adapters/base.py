@@ -20,11 +20,12 @@ from quant_agent.knowledge.store import KnowledgeBundle, KnowledgeStore
 
 
 _CJK = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]")
+_LATIN_WORD = re.compile(r"[A-Za-z0-9_]+")
 
 
 def estimate_token_count(text: str) -> int:
     """Cheap deterministic estimate; exact model tokenization belongs at the LLM boundary."""
-    latin_words = len(re.findall(r"[A-Za-z0-9_]+", text))
+    latin_words = len(_LATIN_WORD.findall(text))
     return max(1, latin_words + len(_CJK.findall(text)))
 
 
@@ -17,6 +17,7 @@ from quant_agent.knowledge.adapters.base import KnowledgeChunkDraft, KnowledgeDo
 
 _HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*$", re.MULTILINE)
 _TICKER = re.compile(r"\b[036]\d{5}\.(?:SZ|SH)\b")
+_SOURCE_THESIS = re.compile(r"^## Source Thesis\s*\n+([^\n]+)", re.MULTILINE)
 
 
 def _chunk_type(section: str) -> KnowledgeChunkType:
@@ -65,7 +66,7 @@ class ThesisNoteAdapter:
             title_match = _HEADING.search(content)
             title = title_match.group(2).strip() if title_match else path.stem
             tickers = tuple(dict.fromkeys(_TICKER.findall(content)))
-            thesis_match = re.search(r"^## Source Thesis\s*\n+([^\n]+)", content, re.MULTILINE)
+            thesis_match = _SOURCE_THESIS.search(content)
             thesis_id = thesis_match.group(1).strip().strip("`") if thesis_match else None
             modified_at = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
             document_id = f"thesis-note/{relative.with_suffix('').as_posix()}"
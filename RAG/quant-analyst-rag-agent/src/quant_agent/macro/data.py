@@ -4,6 +4,8 @@ import csv
 import io
 import json
 import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, replace
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
@@ -53,14 +55,43 @@ def _available_at(observation_date: date, lag_days: int, close_hour_utc: int = 2
     return datetime.combine(observation_date + timedelta(days=lag_days), time(close_hour_utc, 59), tzinfo=timezone.utc)
 
 
+def _fetch_series_concurrently(
+    fetch_one: Callable[[str, DataRequest], list[SourceRecord]],
+    request: DataRequest,
+    workers: int,
+) -> tuple[list[SourceRecord], list[BatchError]]:
+    """Fetch independent series on a small thread pool, keeping request order.
+
+    Repeated symbols are fetched once so duplicates never cost extra round-trips.
+    """
+
+    def attempt(series_id: str) -> list[SourceRecord] | BatchError:
+        try:
+            return fetch_one(series_id, request)
+        except (TransientSourceError, PermanentSourceError) as exc:
+            return BatchError(series_id, type(exc).__name__, str(exc), isinstance(exc, TransientSourceError))
+
+    series_ids = list(dict.fromkeys(request.symbols))
+    records: list[SourceRecord] = []
+    errors: list[BatchError] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(series_ids)))) as pool:
+        for outcome in pool.map(attempt, series_ids):
+            if isinstance(outcome, BatchError):
+                errors.append(outcome)
+            else:
+                records.extend(outcome)
+    return records, errors
+
+
 class FredMacroSource:
     """FRED adapter for rates, credit and Federal Reserve balance-sheet series."""
 
     name = "fred.graph_csv.macro"
     base_url = "https://fred.stlouisfed.org/graph/fredgraph.csv"
 
-    def __init__(self, session: requests.Session | None = None) -> None:
+    def __init__(self, session: requests.Session | None = None, workers: int = 4) -> None:
         self.session = session or requests.Session()
+        self.workers = workers
 
     def _fetch_one(self, canonical_id: str, request: DataRequest) -> list[SourceRecord]:
         metadata = FRED_SERIES.get(canonical_id)
@@ -111,13 +142,7 @@ class FredMacroSource:
         return records
 
     def fetch(self, request: DataRequest) -> DataBatch:
-        records: list[SourceRecord] = []
-        errors: list[BatchError] = []
-        for series_id in request.symbols:
-            try:
-                records.extend(self._fetch_one(series_id, request))
-            except (TransientSourceError, PermanentSourceError) as exc:
-                errors.append(BatchError(series_id, type(exc).__name__, str(exc), isinstance(exc, TransientSourceError)))
+        records, errors = _fetch_series_concurrently(self._fetch_one, request, self.workers)
         return DataBatch.create(dataset=request.dataset, source=self.name, records=records, errors=errors)
 
 
@@ -126,8 +151,9 @@ class CboeVolatilitySource:
 
     name = "cboe.daily_indices"
 
-    def __init__(self, session: requests.Session | None = None) -> None:
+    def __init__(self, session: requests.Session | None = None, workers: int = 4) -> None:
         self.session = session or requests.Session()
+        self.workers = workers
 
     def _fetch_one(self, series_id: str, request: DataRequest) -> list[SourceRecord]:
         url = CBOE_SERIES.get(series_id)
@@ -173,13 +199,7 @@ class CboeVolatilitySource:
         return records
 
     def fetch(self, request: DataRequest) -> DataBatch:
-        records: list[SourceRecord] = []
-        errors: list[BatchError] = []
-        for series_id in request.symbols:
-            try:
-                records.extend(self._fetch_one(series_id, request))
-            except (TransientSourceError, PermanentSourceError) as exc:
-                errors.append(BatchError(series_id, type(exc).__name__, str(exc), isinstance(exc, TransientSourceError)))
+        records, errors = _fetch_series_concurrently(self._fetch_one, request, self.workers)
         return DataBatch.create(dataset=request.dataset, source=self.name, records=records, errors=errors)
 
 
@@ -228,35 +248,46 @@ class AkShareUsMarketSource:
 
 
 def batches_to_observations(batches: list[DataBatch]) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
+    columns: dict[str, list[Any]] = {
+        name: []
+        for name in (
+            "series_id", "observation_date", "available_at", "value", "unit",
+            "source", "is_realtime", "batch_id", "fetched_at",
+        )
+    }
     for batch in batches:
-        for record in batch.records:
-            payload = dict(record.payload)
-            rows.append({
-                "series_id": payload["series_id"],
-                "observation_date": payload["observation_date"],
-                "available_at": record.available_at.isoformat(),
-                "value": float(payload["value"]),
-                "unit": payload["unit"],
-                "source": f"{batch.source}:{payload.get('provider_series_id', record.symbol)}",
-                "is_realtime": bool(payload.get("is_realtime", False)),
-                "batch_id": batch.batch_id,
-                "fetched_at": batch.fetched_at.isoformat(),
-            })
-    if not rows:
+        records = batch.records
+        payloads = [record.payload for record in records]
+        columns["series_id"].extend(payload["series_id"] for payload in payloads)
+        columns["observation_date"].extend(payload["observation_date"] for payload in payloads)
+        columns["available_at"].extend(record.available_at.isoformat() for record in records)
+        columns["value"].extend(float(payload["value"]) for payload in payloads)
+        columns["unit"].extend(payload["unit"] for payload in payloads)
+        columns["source"].extend(
+            f"{batch.source}:{payload.get('provider_series_id', record.symbol)}"
+            for record, payload in zip(records, payloads)
+        )
+        columns["is_realtime"].extend(bool(payload.get("is_realtime", False)) for payload in payloads)
+        # Batch-level fields are formatted once and repeated for the batch's rows.
+        columns["batch_id"].extend([batch.batch_id] * len(records))
+        columns["fetched_at"].extend([batch.fetched_at.isoformat()] * len(records))
+    if not columns["series_id"]:
         raise RuntimeError("all live macro data sources returned no observations")
-    return pd.DataFrame(rows).sort_values(["series_id", "observation_date", "available_at"])
+    return pd.DataFrame(columns).sort_values(["series_id", "observation_date", "available_at"])
 
 
 def fetch_live_macro_observations(as_of: datetime, lookback_days: int = 365 * 6) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
     end_date = as_of.date()
     start_date = end_date - timedelta(days=lookback_days)
     dataset = "macro_regime_observations"
-    batches = [
-        FredMacroSource().fetch(DataRequest(dataset, tuple(FRED_SERIES), start_date, end_date)),
-        CboeVolatilitySource().fetch(DataRequest(dataset, tuple(CBOE_SERIES), start_date, end_date)),
-        AkShareUsMarketSource().fetch(DataRequest(dataset, MARKET_SERIES, start_date, end_date)),
-    ]
+    # One pooled session serves every FRED and CBOE series so keep-alive connections are reused.
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(FredMacroSource(session).fetch, DataRequest(dataset, tuple(FRED_SERIES), start_date, end_date)),
+            pool.submit(CboeVolatilitySource(session).fetch, DataRequest(dataset, tuple(CBOE_SERIES), start_date, end_date)),
+            pool.submit(AkShareUsMarketSource().fetch, DataRequest(dataset, MARKET_SERIES, start_date, end_date)),
+        ]
+        batches = [future.result() for future in futures]
     errors = [asdict(error) | {"source": batch.source} for batch in batches for error in batch.errors]
     return batches_to_observations(batches), errors
 
@@ -302,14 +333,16 @@ def publish_macro_observations(db_path: Path | str, observations: pd.DataFrame,
             record_count INTEGER NOT NULL, error_count INTEGER NOT NULL, error_json TEXT NOT NULL
         )""")
         conn.execute("BEGIN IMMEDIATE")
-        for row in observations.itertuples(index=False):
-            conn.execute("""INSERT INTO macro_source_observations VALUES (?,?,?,?,?,?,?,?,?)
-                ON CONFLICT(series_id,observation_date,source) DO UPDATE SET
-                available_at=excluded.available_at,value=excluded.value,unit=excluded.unit,
-                is_realtime=excluded.is_realtime,batch_id=excluded.batch_id,fetched_at=excluded.fetched_at""",
+        conn.executemany("""INSERT INTO macro_source_observations VALUES (?,?,?,?,?,?,?,?,?)
+            ON CONFLICT(series_id,observation_date,source) DO UPDATE SET
+            available_at=excluded.available_at,value=excluded.value,unit=excluded.unit,
+            is_realtime=excluded.is_realtime,batch_id=excluded.batch_id,fetched_at=excluded.fetched_at""",
+            [
                 (row.series_id, str(row.observation_date), str(row.available_at), float(row.value), row.unit,
-                 row.source, int(row.is_realtime), row.batch_id, row.fetched_at),
-            )
+                 row.source, int(row.is_realtime), row.batch_id, row.fetched_at)
+                for row in observations.itertuples(index=False)
+            ],
+        )
         conn.execute(
             "INSERT OR REPLACE INTO macro_source_runs VALUES (?,?,?,?,?,?)",
             (run_id, now, "published_with_warnings" if errors else "published", len(observations), len(errors),
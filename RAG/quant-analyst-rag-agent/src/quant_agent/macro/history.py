@@ -200,27 +200,34 @@ def publish_macro_history(
             needs_kimi_analysis INTEGER NOT NULL,payload_json TEXT NOT NULL
         )""")
         conn.execute("BEGIN IMMEDIATE")
-        for point in points:
-            payload = json.dumps(asdict(point), ensure_ascii=False, sort_keys=True, default=str)
-            conn.execute("""INSERT INTO macro_snapshots_history VALUES (?,?,?,?,?,?,?,?,?)
-                ON CONFLICT(as_of,model_version) DO UPDATE SET snapshot_id=excluded.snapshot_id,
-                net_liquidity_20d_bn=excluded.net_liquidity_20d_bn,liquidity_score=excluded.liquidity_score,
-                risk_score=excluded.risk_score,rate_pressure_score=excluded.rate_pressure_score,
-                confidence=excluded.confidence,payload_json=excluded.payload_json""",
+        conn.executemany("""INSERT INTO macro_snapshots_history VALUES (?,?,?,?,?,?,?,?,?)
+            ON CONFLICT(as_of,model_version) DO UPDATE SET snapshot_id=excluded.snapshot_id,
+            net_liquidity_20d_bn=excluded.net_liquidity_20d_bn,liquidity_score=excluded.liquidity_score,
+            risk_score=excluded.risk_score,rate_pressure_score=excluded.rate_pressure_score,
+            confidence=excluded.confidence,payload_json=excluded.payload_json""",
+            [
                 (point.as_of.isoformat(), point.model_version, point.snapshot_id, point.net_liquidity_20d_bn,
-                 point.liquidity_score, point.risk_score, point.rate_pressure_score, point.confidence, payload),
-            )
-            for target_id, score in point.target_absorption.items():
-                conn.execute("""INSERT INTO macro_target_history VALUES (?,?,?,?,?,?)
-                    ON CONFLICT(as_of,model_version,target_id) DO UPDATE SET
-                    absorption_score=excluded.absorption_score,state=excluded.state,snapshot_id=excluded.snapshot_id""",
-                    (point.as_of.isoformat(), point.model_version, target_id, score,
-                     point.target_states.get(target_id, "UNKNOWN"), point.snapshot_id),
-                )
-        for event in events:
-            conn.execute(
-                "INSERT OR REPLACE INTO macro_change_events VALUES (?,?,?,?,?,?,?,?)",
+                 point.liquidity_score, point.risk_score, point.rate_pressure_score, point.confidence,
+                 json.dumps(asdict(point), ensure_ascii=False, sort_keys=True, default=str))
+                for point in points
+            ],
+        )
+        conn.executemany("""INSERT INTO macro_target_history VALUES (?,?,?,?,?,?)
+            ON CONFLICT(as_of,model_version,target_id) DO UPDATE SET
+            absorption_score=excluded.absorption_score,state=excluded.state,snapshot_id=excluded.snapshot_id""",
+            [
+                (point.as_of.isoformat(), point.model_version, target_id, score,
+                 point.target_states.get(target_id, "UNKNOWN"), point.snapshot_id)
+                for point in points
+                for target_id, score in point.target_absorption.items()
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO macro_change_events VALUES (?,?,?,?,?,?,?,?)",
+            [
                 (event.event_id, event.as_of.isoformat(), event.window_start.isoformat(), event.window_days,
                  event.event_type, event.entity_id, int(event.needs_kimi_analysis),
-                 json.dumps(asdict(event), ensure_ascii=False, sort_keys=True, default=str)),
-            )
+                 json.dumps(asdict(event), ensure_ascii=False, sort_keys=True, default=str))
+                for event in events
+            ],
+        )
@@ -244,6 +244,19 @@ def _flow_state(score: float) -> LiquidityFlowState:
     return LiquidityFlowState.STRONG_REJECTION
 
 
+# target -> (market series, relative series, liquidity, rate and risk weights)
+_LIQUIDITY_TARGET_SPECS = {
+    "US_LARGE_CAP": ("SPY", "QQQ_SPY", 0.30, -0.12, -0.10),
+    "AI_SEMICONDUCTOR": ("QQQ", "SOXX_QQQ", 0.30, -0.30, -0.08),
+    "US_SMALL_CAP": ("IWM", "IWM_SPY", 0.32, -0.10, -0.35),
+    "US_BANKS_CREDIT": ("KRE", "KRE_SPY", 0.28, 0.05, -0.50),
+    "TREASURY_7_10Y": ("IEF", "IEF_SPY", 0.08, -0.45, 0.22),
+    "TREASURY_20Y_PLUS": ("TLT", "TLT_SPY", 0.08, -0.58, 0.25),
+    "GOLD": ("GLD", "GLD_SPY", 0.18, -0.30, 0.12),
+    "DOLLAR_CASH": ("DXY_PROXY", None, -0.22, 0.20, 0.35),
+}
+
+
 def _liquidity_target_flows(
     features: dict[str, SeriesFeature],
     liquidity_score: float,
@@ -251,18 +264,8 @@ def _liquidity_target_flows(
     risk_score: float,
 ) -> tuple[LiquidityTargetFlow, ...]:
     """Estimate relative liquidity absorption; this is not ETF creation/redemption accounting."""
-    specs = {
-        "US_LARGE_CAP": ("SPY", "QQQ_SPY", 0.30, -0.12, -0.10),
-        "AI_SEMICONDUCTOR": ("QQQ", "SOXX_QQQ", 0.30, -0.30, -0.08),
-        "US_SMALL_CAP": ("IWM", "IWM_SPY", 0.32, -0.10, -0.35),
-        "US_BANKS_CREDIT": ("KRE", "KRE_SPY", 0.28, 0.05, -0.50),
-        "TREASURY_7_10Y": ("IEF", "IEF_SPY", 0.08, -0.45, 0.22),
-        "TREASURY_20Y_PLUS": ("TLT", "TLT_SPY", 0.08, -0.58, 0.25),
-        "GOLD": ("GLD", "GLD_SPY", 0.18, -0.30, 0.12),
-        "DOLLAR_CASH": ("DXY_PROXY", None, -0.22, 0.20, 0.35),
-    }
     output: list[LiquidityTargetFlow] = []
-    for target_id, (market_id, relative_id, liquidity_weight, rate_weight, risk_weight) in specs.items():
+    for target_id, (market_id, relative_id, liquidity_weight, rate_weight, risk_weight) in _LIQUIDITY_TARGET_SPECS.items():
         market = _first(features, market_id, "DXY", "UUP") if target_id == "DOLLAR_CASH" else features.get(market_id)
         return5 = _return(market, "delta_5d")
         return20 = _return(market, "delta_20d")
@@ -325,22 +328,25 @@ def _horizon_field(horizon: StanceHorizon) -> str:
     return "delta_1d" if horizon is StanceHorizon.TACTICAL else "delta_5d" if horizon is StanceHorizon.SWING else "delta_20d"
 
 
+# asset -> (market series, liquidity, rate and risk weights)
+_ASSET_STANCE_SPECS = {
+    "SPX": ("SPY", 0.25, -0.15, -0.25),
+    "NDX": ("QQQ", 0.20, -0.30, -0.20),
+    "RUT": ("IWM", 0.20, -0.10, -0.30),
+    "UST10_PRICE": ("IEF", 0.00, -0.45, 0.20),
+    "UST30_PRICE": ("TLT", 0.00, -0.55, 0.20),
+    "GLD": ("GLD", 0.05, -0.30, 0.10),
+}
+
+
 def _asset_stances(
     features: dict[str, SeriesFeature], as_of: datetime, valid_until: datetime,
     rate_score: float, risk_score: float, liquidity_score: float,
 ) -> tuple[AssetStance, ...]:
     output: list[AssetStance] = []
-    specs = {
-        "SPX": ("SPY", 0.25, -0.15, -0.25),
-        "NDX": ("QQQ", 0.20, -0.30, -0.20),
-        "RUT": ("IWM", 0.20, -0.10, -0.30),
-        "UST10_PRICE": ("IEF", 0.00, -0.45, 0.20),
-        "UST30_PRICE": ("TLT", 0.00, -0.55, 0.20),
-        "GLD": ("GLD", 0.05, -0.30, 0.10),
-    }
     for horizon in StanceHorizon:
         field = _horizon_field(horizon)
-        for asset_id, (market_id, liquidity_weight, rate_weight, risk_weight) in specs.items():
+        for asset_id, (market_id, liquidity_weight, rate_weight, risk_weight) in _ASSET_STANCE_SPECS.items():
             market = features.get(market_id)
             market_return = _return(market, field)
             trend_score = _clip((market_return or 0.0) * 800, -45, 45)
@@ -63,11 +63,14 @@ def run_wave_backtest(
         rebalance_dates = set(benchmark_signals.iloc[::holding_days]["date"])
     else:
         raise ValueError("unsupported signal_frequency")
+    # Split candidates by signal date once instead of rescanning the frame for every rebalance.
+    candidates_by_date = dict(tuple(candidates.groupby("date", sort=False)))
+    no_candidates = candidates.iloc[0:0]
     for signal_date, group in benchmark_signals.groupby("date"):
         if signal_date not in rebalance_dates:
             continue
         benchmark_row = group.iloc[0]
-        day = candidates.loc[candidates["date"] == signal_date].nlargest(top_n, ["wave_score", "rs_market_20d"])
+        day = candidates_by_date.get(signal_date, no_candidates).nlargest(top_n, ["wave_score", "rs_market_20d"])
         holdings = set(day["ticker"].tolist())
         if holdings:
             denominator = max(len(holdings), len(previous), 1)
@@ -19,6 +19,7 @@ REQUIRED_MARKET_COLUMNS = {
     "amount",
     "turnover_rate",
 }
+_ABNORMAL_MOVEMENT = "交易异常波动"
 
 
 def _datetime_ns(values: pd.Series) -> pd.Series:
@@ -135,8 +136,14 @@ def _attach_benchmark(features: pd.DataFrame, benchmark: pd.DataFrame) -> pd.Dat
     benchmark = benchmark[["date", "close"]].copy().sort_values("date")
     benchmark["date"] = _datetime_ns(benchmark["date"])
     benchmark["benchmark_return_20d"] = benchmark["close"].pct_change(20, fill_method=None)
-    benchmark = benchmark.rename(columns={"close": "benchmark_close"})
-    features = features.merge(benchmark, on="date", how="left", validate="many_to_one")
+    benchmark = benchmark.rename(columns={"close": "benchmark_close"}).set_index("date")
+    if not benchmark.index.is_unique:
+        raise ValueError("benchmark contains duplicate dates")
+    aligned = benchmark.reindex(features["date"])
+    features = features.assign(
+        benchmark_close=aligned["benchmark_close"].to_numpy(),
+        benchmark_return_20d=aligned["benchmark_return_20d"].to_numpy(),
+    )
     features["rs_market_20d"] = features["return_20d"] - features["benchmark_return_20d"]
     return features
 
@@ -173,9 +180,10 @@ def _attach_narratives(features: pd.DataFrame, narratives: pd.DataFrame) -> pd.D
     # Abnormal-movement announcements are reactive disclosures triggered by price
     # action. Joining them into signal features would recycle an already observed
     # move as textual evidence, so they remain in the source table for audit only.
-    excluded_event = narratives["event_type"].astype("string").str.contains("交易异常波动", na=False)
-    excluded_title = narratives["source_title"].astype("string").str.contains("交易异常波动", na=False)
-    narratives = narratives.loc[~(excluded_event | excluded_title)].copy()
+    excluded = pd.Series(False, index=narratives.index)
+    for column in ("event_type", "source_title"):
+        excluded |= narratives[column].astype("string").str.contains(_ABNORMAL_MOVEMENT, regex=False, na=False)
+    narratives = narratives.loc[~excluded].copy()
 
     event_columns = [
         "event_id",
@@ -290,14 +298,15 @@ def _add_coverage_metadata(features: pd.DataFrame) -> pd.DataFrame:
         "market_cross_section": ["amount_rank_market", "rs_rank_market_20d"],
     }
 
-    def summarize(row: pd.Series) -> tuple[float, str]:
-        missing = [name for name, columns in coverage_groups.items() if row[columns].isna().any()]
-        coverage = (len(coverage_groups) - len(missing)) / len(coverage_groups)
-        return coverage, "|".join(missing)
-
-    summaries = features.apply(summarize, axis=1, result_type="expand")
-    features["feature_coverage"] = summaries[0].astype(float)
-    features["missing_feature_groups"] = summaries[1]
+    missing = pd.DataFrame(
+        {name: features[columns].isna().any(axis=1) for name, columns in coverage_groups.items()},
+        index=features.index,
+    )
+    features["feature_coverage"] = (len(coverage_groups) - missing.sum(axis=1)) / len(coverage_groups)
+    group_names = list(coverage_groups)
+    features["missing_feature_groups"] = [
+        "|".join(name for name, is_missing in zip(group_names, flags) if is_missing) for flags in missing.to_numpy()
+    ]
     return features
 
 
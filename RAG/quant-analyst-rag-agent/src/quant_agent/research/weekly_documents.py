@@ -7,6 +7,7 @@ from dataclasses import replace
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from domain.weekly_document import (
@@ -24,15 +25,17 @@ def _hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def _wave_state(row: pd.Series) -> str:
-    if bool(row.get("high_volume_stall_flag")) or float(row.get("risk_penalty", 0)) >= 10:
-        return "DISTRIBUTION_RISK"
-    score = float(row["wave_score"])
-    if score >= 75:
-        return "MAIN_UPTREND_CONFIRMED"
-    if score >= 60:
-        return "BREAKOUT_CANDIDATE"
-    return "WATCHLIST"
+def _wave_states(frame: pd.DataFrame) -> pd.Series:
+    """Bucket every row into a wave state in one vectorized pass."""
+    stall = frame["high_volume_stall_flag"].astype(bool) if "high_volume_stall_flag" in frame else False
+    penalty = frame["risk_penalty"].astype(float) if "risk_penalty" in frame else 0.0
+    score = frame["wave_score"].astype(float)
+    states = np.select(
+        [stall | (penalty >= 10), score >= 75, score >= 60],
+        ["DISTRIBUTION_RISK", "MAIN_UPTREND_CONFIRMED", "BREAKOUT_CANDIDATE"],
+        default="WATCHLIST",
+    )
+    return pd.Series(states, index=frame.index, dtype=object)
 
 
 def _week_bounds(day: date) -> tuple[date, date]:
@@ -99,7 +102,7 @@ def build_weekly_documents(
     iso = frame["date"].dt.isocalendar()
     frame["iso_year"] = iso.year
     frame["iso_week"] = iso.week
-    frame["wave_state"] = frame.apply(_wave_state, axis=1)
+    frame["wave_state"] = _wave_states(frame)
     documents: list[WeeklyResearchDocument] = []
     chunks: list[WeeklyKnowledgeChunk] = []
     as_of_dt = datetime.combine(as_of_date, datetime.max.time(), tzinfo=timezone.utc)
@@ -4,6 +4,8 @@ import re
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
+_WORD = re.compile(r"\S+")
+
 
 @dataclass(frozen=True)
 class DocumentChunk:
@@ -48,7 +50,7 @@ def load_markdown_documents(docs_dir: Path) -> list[DocumentChunk]:
             continue
         title = _title_from_text(path, text)
         relative = path.relative_to(docs_dir).as_posix()
-        words = re.findall(r"\S+", text)
+        words = _WORD.findall(text)
         for index, chunk_text in enumerate(_chunks(words)):
             chunks.append(DocumentChunk(f"{relative}::{index}", title, relative, chunk_text, title))
     return chunks
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -8,6 +10,20 @@ from quant_agent.retrieval.document_loader import DocumentChunk, load_markdown_d
 from quant_agent.retrieval.vector_retriever import VectorRetriever
 
 
+# Unpickled indexes keyed by (path, mtime_ns, size) of both files, so repeated
+# loads reuse them until a rebuild rewrites either file. build_retrievers also
+# clears it, since a same-size rewrite within one mtime tick keeps the key.
+# Past the limit the least recently used pair is evicted.
+_LOADED_INDEXES: OrderedDict[tuple[tuple[str, int, int], ...], tuple[BM25Retriever, VectorRetriever]] = OrderedDict()
+_LOADED_INDEX_LIMIT = 4
+_LOADED_INDEXES_LOCK = threading.Lock()
+
+
+def _file_identity(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
 def _normalize(scores: dict[str, float]) -> dict[str, float]:
     if not scores:
         return {}
@@ -27,7 +43,16 @@ class HybridRetriever:
 
     @classmethod
     def from_paths(cls, bm25_path: Path, vector_path: Path, alpha: float = 0.5) -> "HybridRetriever":
-        return cls(BM25Retriever.load(bm25_path), VectorRetriever.load(vector_path), alpha)
+        key = (_file_identity(bm25_path), _file_identity(vector_path))
+        with _LOADED_INDEXES_LOCK:
+            indexes = _LOADED_INDEXES.get(key)
+            if indexes is None:
+                indexes = _LOADED_INDEXES[key] = (BM25Retriever.load(bm25_path), VectorRetriever.load(vector_path))
+                if len(_LOADED_INDEXES) > _LOADED_INDEX_LIMIT:
+                    _LOADED_INDEXES.popitem(last=False)
+            else:
+                _LOADED_INDEXES.move_to_end(key)
+        return cls(*indexes, alpha)
 
     def search(self, query: str, top_k: int = 5) -> list[dict[str, object]]:
         bm25_results = self.bm25.search(query, top_k=max(top_k * 3, 10))
@@ -54,4 +79,6 @@ def build_retrievers(docs_dir: Path, bm25_path: Path, vector_path: Path) -> tupl
     vector = VectorRetriever.from_documents(documents)
     bm25.save(bm25_path)
     vector.save(vector_path)
+    with _LOADED_INDEXES_LOCK:
+        _LOADED_INDEXES.clear()
     return bm25, vector
@@ -14,6 +14,7 @@ from quant_agent.knowledge.store import KnowledgeStore, StoredKnowledgeChunk
 INDEX_VERSION = "canonical-lexical-v1.1.0"
 _LATIN_TOKEN = re.compile(r"[a-z0-9]+(?:[._:/-][a-z0-9]+)*", re.IGNORECASE)
 _CJK_RUN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]+")
+_TOKEN_PART_SEPARATOR = re.compile(r"[._:/]")
 _QUERY_STOPWORDS = {
     "a", "an", "and", "are", "as", "at", "be", "by", "did", "do", "does",
     "for", "from", "how", "in", "is", "it", "of", "on", "or", "the", "to",
@@ -27,11 +28,19 @@ _ALIASES = {
     "liquidity": ("流动性", "liquidity"),
     "artificial_intelligence": ("人工智能", "ai"),
 }
+# Latin aliases must match on word boundaries; CJK aliases are plain substrings.
+_LATIN_ALIAS_PATTERNS = {
+    alias: re.compile(rf"(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])")
+    for aliases in _ALIASES.values()
+    for alias in aliases
+    if re.fullmatch(r"[a-z0-9 ]+", alias)
+}
 
 
 def _contains_alias(normalized: str, alias: str) -> bool:
-    if re.fullmatch(r"[a-z0-9 ]+", alias):
-        return re.search(rf"(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])", normalized) is not None
+    pattern = _LATIN_ALIAS_PATTERNS.get(alias)
+    if pattern is not None:
+        return pattern.search(normalized) is not None
     return alias in normalized
 
 
@@ -42,7 +51,7 @@ def tokenize_lexical(text: str) -> list[str]:
     for token in _LATIN_TOKEN.findall(normalized):
         cleaned = token.replace("-", "_")
         tokens.append(cleaned)
-        tokens.extend(part for part in re.split(r"[._:/]", cleaned) if part and part != cleaned)
+        tokens.extend(part for part in _TOKEN_PART_SEPARATOR.split(cleaned) if part and part != cleaned)
     for run in _CJK_RUN.findall(normalized):
         chars = list(run)
         tokens.extend(chars)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +21,7 @@ from quant_agent.knowledge.store import KnowledgeBundle, KnowledgeStore
 
 _HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*$", re.MULTILINE)
 _CJK = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]")
+_LATIN_WORD = re.compile(r"[A-Za-z0-9_]+")
 _TICKER = re.compile(r"\b(?:[036]\d{5}\.(?:SZ|SH)|[A-Z]{1,6})\b")
 
 
@@ -98,7 +100,7 @@ def _split_text(text: str, *, max_chars: int, overlap_chars: int) -> list[str]:
 
 
 def _token_count(text: str) -> int:
-    latin_words = len(re.findall(r"[A-Za-z0-9_]+", text))
+    latin_words = len(_LATIN_WORD.findall(text))
     cjk_chars = len(_CJK.findall(text))
     return max(1, latin_words + cjk_chars)
 
@@ -114,14 +116,31 @@ def migrate_markdown_documents(
     project_root: Path | str | None = None,
     max_chunk_chars: int = 2_000,
     overlap_chars: int = 200,
+    files: Iterable[Path | str] | None = None,
 ) -> MarkdownMigrationResult:
-    """Idempotently publish Markdown files into the canonical KnowledgeStore."""
+    """Idempotently publish Markdown files into the canonical KnowledgeStore.
+
+    Callers that already know which files changed can pass ``files`` to skip
+    rescanning ``docs_dir``; each must be an existing ``.md`` file under it.
+    """
     if max_chunk_chars < 200:
         raise ValueError("max_chunk_chars must be >= 200")
     if not 0 <= overlap_chars < max_chunk_chars:
         raise ValueError("overlap_chars must be >= 0 and smaller than max_chunk_chars")
     root = Path(docs_dir).resolve()
-    files = sorted(root.rglob("*.md")) if root.exists() else []
+    if files is None:
+        files = sorted(root.rglob("*.md")) if root.exists() else []
+    else:
+        files = sorted({Path(path).resolve() for path in files})
+        outside = [path for path in files if not path.is_relative_to(root)]
+        if outside:
+            raise ValueError(f"files must be under {root}: {[path.as_posix() for path in outside]}")
+        not_markdown = [path for path in files if path.suffix != ".md"]
+        if not_markdown:
+            raise ValueError(f"files must be Markdown (.md): {[path.as_posix() for path in not_markdown]}")
+        missing = [path for path in files if not path.is_file()]
+        if missing:
+            raise ValueError(f"files do not exist: {[path.as_posix() for path in missing]}")
     bundles: list[KnowledgeBundle] = []
     skipped = 0
     chunk_count = 0
@@ -93,8 +93,10 @@ def build_reversal_features(
     for ticker, group in histories.groupby("ticker", sort=False):
         group = group.sort_values("date").drop_duplicates("date", keep="last").copy()
         group["date"] = pd.to_datetime(group["date"])
-        current_rows = group.loc[group["date"] == as_of]
-        if current_rows.empty:
+        is_current = group["date"].eq(as_of)
+        is_previous = group["date"].lt(as_of)
+        # Skip the rolling-window work for tickers that cannot qualify.
+        if not is_current.any() or is_previous.sum() < 120:
             continue
         close = group["close"]
         group["ma5"] = close.rolling(5, min_periods=5).mean()
@@ -110,12 +112,13 @@ def build_reversal_features(
         group["volume_ratio_20d"] = group["volume"] / group["volume"].shift(1).rolling(20, min_periods=20).mean()
         group["leader_signature"] = _leader_signature(group, benchmark_returns)
         group["prior_leader_score_20d"] = group["leader_signature"].shift(1).rolling(20, min_periods=1).max()
-        previous = group.loc[group["date"] < as_of]
-        current = group.loc[group["date"] == as_of].iloc[-1]
-        if len(previous) < 120:
-            continue
-        pre_return_3d = float(previous.iloc[-1]["close"] / previous.iloc[-4]["close"] - 1)
-        pre_drawdown_5d = float(previous.iloc[-1]["close"] / previous.tail(5)["close"].max() - 1)
+        previous = group.loc[is_previous]
+        current = group.loc[is_current].iloc[-1]
+        previous_close = previous["close"].to_numpy(dtype=float)
+        last_close = previous_close[-1]
+        pre_return_3d = float(last_close / previous_close[-4] - 1)
+        pre_drawdown_5d = float(last_close / previous["close"].iloc[-5:].max() - 1)
+        return_1d = float(current["close"] / last_close - 1)
         spread = float(current["high"] - current["low"])
         location = float((current["close"] - current["low"]) / spread) if spread > 0 else 0.5
         market_return20 = float(benchmark_returns.get(as_of, np.nan))
@@ -123,12 +126,12 @@ def build_reversal_features(
         volume_data_reliable = bool(np.isfinite(raw_volume_ratio) and 0.05 <= raw_volume_ratio <= 20.0)
         row = {
             "date": as_of, "ticker": ticker, "name": current["name"], "close": float(current["close"]),
-            "return_1d": float(current["close"] / previous.iloc[-1]["close"] - 1),
+            "return_1d": return_1d,
             "return_5d": float(current["return_5d"]), "return_20d": float(current["return_20d"]),
             "pre_selloff_return_3d": pre_return_3d, "market_pre_selloff_return_3d": market_pre_return_3d,
             "selloff_resilience_3d": pre_return_3d - market_pre_return_3d,
             "pre_drawdown_5d": pre_drawdown_5d, "market_pre_drawdown_5d": market_pre_drawdown_5d,
-            "recovery_vs_market_1d": float(current["close"] / previous.iloc[-1]["close"] - 1) - market_return_1d,
+            "recovery_vs_market_1d": return_1d - market_return_1d,
             "intraday_close_location": location, "close_vs_open": float(current["close"] / current["open"] - 1),
             "above_ma5": bool(current["close"] >= current["ma5"]), "above_ma10": bool(current["close"] >= current["ma10"]),
             "above_ma20": bool(current["close"] >= current["ma20"]), "ma20_above_ma60": bool(current["ma20"] >= current["ma60"]),
@@ -143,7 +146,7 @@ def build_reversal_features(
             "prior_leader_score_20d": float(current["prior_leader_score_20d"]),
             "current_leader_score": float(current["leader_signature"]),
             "history_days": len(group),
-            "locked_limit_up": bool(np.isclose(current["high"], current["low"]) and current["close"] > previous.iloc[-1]["close"] * 1.095),
+            "locked_limit_up": bool(np.isclose(current["high"], current["low"]) and current["close"] > last_close * 1.095),
             "feature_version": REVERSAL_FEATURE_VERSION,
         }
         rows.append(row)
@@ -290,21 +293,9 @@ def publish_reversal_screen(
             "risk_flags", "exclusion_reasons",
         }
         source_json = json.dumps(source_metadata, ensure_ascii=False, sort_keys=True)
-        for record in scored.to_dict(orient="records"):
-            feature_payload: dict[str, object] = {}
-            for key, value in record.items():
-                if key in excluded:
-                    continue
-                if pd.isna(value):
-                    feature_payload[key] = None
-                elif isinstance(value, (np.bool_, bool)):
-                    feature_payload[key] = bool(value)
-                elif isinstance(value, (np.integer, int)):
-                    feature_payload[key] = int(value)
-                elif isinstance(value, (np.floating, float)):
-                    feature_payload[key] = float(value)
-                else:
-                    feature_payload[key] = value
+        feature_values = scored.drop(columns=[column for column in scored.columns if column in excluded])
+        payloads = feature_values.astype(object).where(feature_values.notna(), None).to_dict(orient="records")
+        for record, feature_payload in zip(scored.to_dict(orient="records"), payloads):
             conn.execute(
                 "INSERT INTO gold_cn_reversal_screen_results VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
                 (
@@ -66,10 +66,10 @@ def build_wave_features(prices: pd.DataFrame) -> pd.DataFrame:
     prices = prices.copy()
     prices["date"] = pd.to_datetime(prices["date"])
     features = pd.concat([_one_security(group) for _, group in prices.groupby("ticker", sort=False)], ignore_index=True)
-    benchmark = features.loc[features["ticker"] == BENCHMARK, ["date", "return_20d"]].rename(
-        columns={"return_20d": "benchmark_return_20d"}
-    )
-    features = features.merge(benchmark, on="date", how="left", validate="many_to_one")
+    benchmark_return = features.loc[features["ticker"] == BENCHMARK].set_index("date")["return_20d"]
+    if not benchmark_return.index.is_unique:
+        raise ValueError("benchmark prices contain duplicate dates")
+    features["benchmark_return_20d"] = features["date"].map(benchmark_return)
     features["rs_market_20d"] = features["return_20d"] - features["benchmark_return_20d"]
     stock_mask = features["ticker"] != BENCHMARK
     features["amount_rank_pilot"] = np.nan
@@ -169,8 +169,9 @@ def score_wave_features(features: pd.DataFrame) -> pd.DataFrame:
 
 def screen_as_of(scored: pd.DataFrame, as_of: str | pd.Timestamp, top_n: int = 5) -> pd.DataFrame:
     as_of = pd.Timestamp(as_of)
-    snapshot = scored.loc[scored["date"] <= as_of].sort_values("date").groupby("ticker", as_index=False).tail(1)
-    snapshot = snapshot.loc[snapshot["date"] == as_of].copy()
+    # A ticker's latest row on or before as_of survives only if it is dated as_of, so
+    # filtering on the date directly avoids sorting the whole history.
+    snapshot = scored.loc[scored["date"] == as_of].drop_duplicates("ticker", keep="last").copy()
     snapshot["rank"] = snapshot.loc[snapshot["eligible"], "wave_score"].rank(method="first", ascending=False)
     snapshot["selected"] = snapshot["eligible"] & snapshot["rank"].le(top_n)
     return snapshot.sort_values(["selected", "wave_score"], ascending=[False, False]).reset_index(drop=True)
@@ -213,7 +214,7 @@ def publish_screen(
             universe_scope TEXT NOT NULL,PRIMARY KEY(as_of,ticker,score_version))"""
         )
         for ticker, group in scored.groupby("ticker"):
-            first = group.sort_values("date").iloc[0]
+            first = group.loc[group["date"].idxmin()]
             exchange = ticker.split(".")[-1]
             board = "benchmark" if ticker == BENCHMARK else ("chinext" if ticker.startswith(("300", "301")) else "star" if ticker.startswith("688") else "main")
             conn.execute(
@@ -229,27 +230,28 @@ def publish_screen(
         ]
         conn.execute("DELETE FROM gold_cn_features WHERE feature_version=?", (FEATURE_VERSION,))
         conn.execute("DELETE FROM gold_cn_tradability")
-        for row in scored.itertuples(index=False):
-            payload = {}
-            for field in feature_fields:
-                value = getattr(row, field)
-                payload[field] = None if pd.isna(value) else (bool(value) if isinstance(value, (bool, np.bool_)) else float(value) if isinstance(value, (float, np.floating)) else int(value) if isinstance(value, (int, np.integer)) else value)
-            conn.execute(
-                "INSERT INTO gold_cn_features VALUES (?,?,?,?,?)",
-                (row.date.date().isoformat(), row.ticker, FEATURE_VERSION, json.dumps(payload, ensure_ascii=False, sort_keys=True), row.source_run_id),
-            )
-            conn.execute(
-                "INSERT INTO gold_cn_tradability VALUES (?,?,?,?,?,?,?,?,?,?,?)",
-                (row.date.date().isoformat(),row.ticker,1,int(float(row.volume)<=0),None,0,int(row.eligible),row.exclusion_reasons,float(row.limit_ratio),"historical ST status unavailable in pilot",row.source_run_id),
+        feature_rows = []
+        tradability_rows = []
+        trade_dates = scored["date"].dt.strftime("%Y-%m-%d").tolist()
+        # Casting to object boxes NumPy scalars as native bool/int/float column by column.
+        feature_values = scored[feature_fields]
+        payloads = feature_values.astype(object).where(feature_values.notna(), None).to_dict(orient="records")
+        for trade_date, payload, row in zip(trade_dates, payloads, scored.itertuples(index=False)):
+            feature_rows.append((trade_date, row.ticker, FEATURE_VERSION, json.dumps(payload, ensure_ascii=False, sort_keys=True), row.source_run_id))
+            tradability_rows.append(
+                (trade_date,row.ticker,1,int(float(row.volume)<=0),None,0,int(row.eligible),row.exclusion_reasons,float(row.limit_ratio),"historical ST status unavailable in pilot",row.source_run_id)
             )
+        conn.executemany("INSERT INTO gold_cn_features VALUES (?,?,?,?,?)", feature_rows)
+        conn.executemany("INSERT INTO gold_cn_tradability VALUES (?,?,?,?,?,?,?,?,?,?,?)", tradability_rows)
         as_of = snapshot["date"].iloc[0].date().isoformat()
         conn.execute("DELETE FROM gold_cn_screen_results WHERE as_of=? AND score_version=?", (as_of, SCORE_VERSION))
+        screen_rows = []
         for row in snapshot.itertuples(index=False):
             components = {name: getattr(row, name) for name in ("trend_score", "breakout_score", "momentum_score", "relative_strength_score", "volume_score", "risk_quality_score", "risk_penalty")}
-            conn.execute(
-                "INSERT INTO gold_cn_screen_results VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
-                (as_of,row.ticker,row.name,int(row.eligible),int(row.selected),None if pd.isna(row.rank) else float(row.rank),float(row.wave_score),json.dumps(components,ensure_ascii=False),row.exclusion_reasons,row.top_reasons,row.risk_flags,row.feature_version,row.score_version,row.source_run_id,"phase2_pilot_8_stocks"),
+            screen_rows.append(
+                (as_of,row.ticker,row.name,int(row.eligible),int(row.selected),None if pd.isna(row.rank) else float(row.rank),float(row.wave_score),json.dumps(components,ensure_ascii=False),row.exclusion_reasons,row.top_reasons,row.risk_flags,row.feature_version,row.score_version,row.source_run_id,"phase2_pilot_8_stocks")
             )
+        conn.executemany("INSERT INTO gold_cn_screen_results VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)", screen_rows)
     columns = ["date","rank","ticker","name","selected","eligible","wave_score","trend_score","breakout_score","momentum_score","relative_strength_score","volume_score","risk_quality_score","risk_penalty","top_reasons","risk_flags","exclusion_reasons","feature_version","score_version","source_run_id"]
     csv_path = output_dir / f"cn_wave_screen_{as_of}.csv"
     snapshot[columns].to_csv(csv_path, index=False, encoding="utf-8-sig")
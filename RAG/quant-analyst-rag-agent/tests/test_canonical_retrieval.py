@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from domain.knowledge import (
     KnowledgeChunk,
     KnowledgeChunkType,
@@ -159,3 +161,28 @@ def test_markdown_migration_is_idempotent_and_content_change_creates_version(tmp
     assert third.migrated_documents == 1
     assert store.get_document("markdown/factor_definitions/liquidity").version == 2
     assert index.count() == 1
+
+
+def test_markdown_migration_publishes_only_the_given_files(tmp_path) -> None:
+    docs = tmp_path / "data" / "docs" / "factor_definitions"
+    docs.mkdir(parents=True)
+    (docs / "liquidity.md").write_text("# 流动性\n\n资金价格与真实利率。", encoding="utf-8")
+    changed = docs / "momentum.md"
+    changed.write_text("# Momentum\n\nSixty-day price trend.", encoding="utf-8")
+    store, _, _ = _runtime(tmp_path)
+
+    result = migrate_markdown_documents(store, tmp_path / "data" / "docs", project_root=tmp_path, files=[changed])
+
+    assert result.discovered_files == 1
+    assert result.migrated_documents == 1
+    assert store.get_document("markdown/factor_definitions/momentum") is not None
+    assert store.get_document("markdown/factor_definitions/liquidity") is None
+    with pytest.raises(ValueError, match="must be under"):
+        migrate_markdown_documents(store, docs, files=[tmp_path / "outside.md"])
+    notes = docs / "notes.txt"
+    notes.write_text("# Notes\n\nNot Markdown.", encoding="utf-8")
+    with pytest.raises(ValueError, match=r"must be Markdown"):
+        migrate_markdown_documents(store, docs, files=[notes])
+    with pytest.raises(ValueError, match="do not exist"):
+        migrate_markdown_documents(store, docs, files=[docs / "deleted.md"])
+    assert store.get_document("markdown/notes") is None
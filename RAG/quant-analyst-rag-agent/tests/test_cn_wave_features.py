@@ -72,6 +72,8 @@ def test_features_respect_narrative_available_at_and_missing_cross_section() ->
     assert pd.isna(at_event["amount_rank_market"])
     assert pd.notna(features.iloc[249]["rolling_high_250d"])
     assert pd.notna(features.iloc[59]["chip_concentration_60d"])
+    assert features.iloc[-1]["missing_feature_groups"] == "market_cross_section"
+    assert features.iloc[-1]["feature_coverage"] == 5 / 6
     assert features["is_labeled_positive"].sum() == 11
     assert features["is_labeled_negative"].sum() == 0
 
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from quant_agent.config import Paths
+
+
+def _project(root: Path) -> Path:
+    (root / "src" / "quant_agent").mkdir(parents=True)
+    (root / "pyproject.toml").write_text("[project]\nname = 'fixture'\n", encoding="utf-8")
+    return root.resolve()
+
+
+def test_project_root_follows_env_override_and_cwd_changes(tmp_path, monkeypatch) -> None:
+    first = _project(tmp_path / "first")
+    second = _project(tmp_path / "second")
+    monkeypatch.delenv("QUANT_AGENT_PROJECT_ROOT", raising=False)
+
+    monkeypatch.chdir(first / "src")
+    assert Paths().project_root == first
+    monkeypatch.chdir(second)
+    assert Paths().project_root == second
+
+    monkeypatch.setenv("QUANT_AGENT_PROJECT_ROOT", str(first))
+    assert Paths().project_root == first
+    monkeypatch.delenv("QUANT_AGENT_PROJECT_ROOT")
+
+    (second / "pyproject.toml").unlink()
+    assert Paths().project_root != second
+    (second / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+    assert Paths().project_root == second
@@ -5,3 +5,20 @@ from quant_agent.retrieval.hybrid_retriever import HybridRetriever
 def test_hybrid_retrieves_march_2020_momentum_note():
     paths = Paths(); docs = load_markdown_documents(paths.docs_dir); retriever = HybridRetriever.from_documents(docs); results = retriever.search("What caused momentum to underperform in March 2020?", top_k=3)
     assert any(row["source_path"] == "research_notes/march_2020_momentum_underperformance.md" for row in results); assert "hybrid_score" in results[0]
+
+def test_from_paths_reuses_loaded_indexes_until_rebuilt(tmp_path):
+    from quant_agent.retrieval.hybrid_retriever import build_retrievers
+    paths = Paths(); bm25_path = tmp_path / "bm25.pkl"; vector_path = tmp_path / "vector.pkl"; build_retrievers(paths.docs_dir, bm25_path, vector_path)
+    first = HybridRetriever.from_paths(bm25_path, vector_path); second = HybridRetriever.from_paths(bm25_path, vector_path)
+    assert second.bm25 is first.bm25 and second.vector is first.vector
+    build_retrievers(paths.docs_dir, bm25_path, vector_path)
+    assert HybridRetriever.from_paths(bm25_path, vector_path).bm25 is not first.bm25
+
+def test_from_paths_is_safe_under_concurrent_loads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from quant_agent.retrieval.hybrid_retriever import build_retrievers
+    paths = Paths(); pairs = []
+    for index in range(6):
+        bm25_path = tmp_path / f"bm25_{index}.pkl"; vector_path = tmp_path / f"vector_{index}.pkl"; build_retrievers(paths.docs_dir, bm25_path, vector_path); pairs.append((bm25_path, vector_path))
+    with ThreadPoolExecutor(max_workers=8) as pool: loaded = list(pool.map(lambda pair: HybridRetriever.from_paths(*pair), pairs * 10))
+    assert len(loaded) == 60
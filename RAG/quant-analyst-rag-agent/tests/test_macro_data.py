@@ -59,3 +59,30 @@ def test_macro_observation_cache_is_idempotent(tmp_path) -> None:
     assert count == 1
     assert len(loaded) == 1
 
+
+def test_fred_concurrent_fetch_keeps_request_order_and_isolates_errors() -> None:
+    class _PerSeriesSession:
+        def get(self, url, params, timeout) -> _Response:
+            if params["id"] == "DGS2":
+                return _Response("", status_code=404)
+            return _Response(f"observation_date,{params['id']}\n2026-07-14,1.0\n")
+
+    source = FredMacroSource(_PerSeriesSession(), workers=3)
+    request = DataRequest("macro_regime_observations", ("DGS30", "DGS2", "DGS10"), date(2026, 7, 1), date(2026, 7, 15))
+    batch = source.fetch(request)
+    assert [record.symbol for record in batch.records] == ["DGS30", "DGS10"]
+    assert [(error.symbol, error.retryable) for error in batch.errors] == [("DGS2", False)]
+
+
+def test_fred_fetches_repeated_series_once() -> None:
+    requested: list[str] = []
+
+    class _CountingSession:
+        def get(self, url, params, timeout) -> _Response:
+            requested.append(params["id"])
+            return _Response(f"observation_date,{params['id']}\n2026-07-14,1.0\n")
+
+    request = DataRequest("macro_regime_observations", ("DGS10", "DGS2", "DGS10"), date(2026, 7, 1), date(2026, 7, 15))
+    batch = FredMacroSource(_CountingSession(), workers=2).fetch(request)
+    assert sorted(requested) == ["DGS10", "DGS2"]
+    assert [record.symbol for record in batch.records] == ["DGS10", "DGS2"]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 import math
+import warnings
+from zoneinfo import ZoneInfo
 
+import pandas as pd
 import pytest
 
-from quant_agent.data_sources.base import DataBatch, DataQualityError, SourceRecord, TransientSourceError, with_retry
+from quant_agent.data_sources.base import DataBatch, DataQualityError, DataRequest, SourceRecord, TransientSourceError, with_retry
+from quant_agent.data_sources.pilot_market import PilotParquetMarketSource
 from quant_agent.pipeline.warehouse import PhaseWarehouse
 
 
@@ -76,3 +80,28 @@ def test_non_finite_value_is_rejected_before_publish(tmp_path) -> None:
     with pytest.raises(DataQualityError, match="non-finite"):
         warehouse.ingest_batch(DataBatch.create(dataset="cn_daily", source="fixture", records=[_record(math.nan)]))
     assert warehouse.table_count("gold_cn_prices") == 0
+
+
+@pytest.mark.parametrize("tz", [None, "Asia/Shanghai"])
+def test_pilot_parquet_source_emits_shanghai_session_records(tmp_path, tz) -> None:
+    dates = pd.date_range("2026-01-05", periods=3, freq="D", tz=tz)
+    prices = pd.DataFrame({
+        "date": dates, "ticker": "000001.SZ", "stock_name": "测试股票", "open": 10.0, "high": 11.0,
+        "low": 9.5, "close": 10.5, "volume": [1000.0, None, 1000.0], "amount": 10000.0, "turnover_rate": 0.02,
+    })
+    benchmark = pd.DataFrame({"date": dates, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0, "amount": 1.0})
+    prices.to_parquet(tmp_path / "prices.parquet")
+    benchmark.to_parquet(tmp_path / "benchmark.parquet")
+    source = PilotParquetMarketSource(tmp_path / "prices.parquet", tmp_path / "benchmark.parquet")
+
+    request = DataRequest("cn_daily", ("000001.SZ",), date(2026, 1, 6), date(2026, 1, 7))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        records = source.fetch(request).records
+
+    expected_time = datetime(2026, 1, 6, tzinfo=ZoneInfo("Asia/Shanghai"))
+    assert [record.payload["trade_date"] for record in records] == ["2026-01-06", "2026-01-07"]
+    assert records[0].event_time == expected_time and records[0].available_at == expected_time
+    assert records[0].event_time.utcoffset() == timedelta(hours=8)
+    assert records[0].payload["volume"] == 0.0
+    assert records[1].payload["close"] == 10.5
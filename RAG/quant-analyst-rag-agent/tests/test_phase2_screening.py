@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sqlite3
+
 import numpy as np
 import pandas as pd
 
-from quant_agent.screening.wave import build_wave_features, score_wave_features, screen_as_of
+from quant_agent.screening.wave import build_wave_features, publish_screen, score_wave_features, screen_as_of
 
 
 def _prices() -> pd.DataFrame:
@@ -38,3 +40,20 @@ def test_screen_outputs_explainable_components() -> None:
     assert selected.iloc[0]["ticker"] != "000300.SH"
     assert selected.iloc[0]["top_reasons"]
     assert snapshot.loc[snapshot["ticker"] == "000300.SH", "exclusion_reasons"].str.contains("benchmark").all()
+
+
+def test_publish_screen_writes_every_feature_and_screen_row(tmp_path) -> None:
+    scored = score_wave_features(build_wave_features(_prices()))
+    snapshot = screen_as_of(scored, scored["date"].max(), top_n=1)
+    db_path = tmp_path / "quant.db"
+
+    publish_screen(db_path, scored, snapshot, tmp_path / "reports")
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM gold_cn_features").fetchone()[0] == len(scored)
+        assert conn.execute("SELECT COUNT(*) FROM gold_cn_tradability").fetchone()[0] == len(scored)
+        assert conn.execute("SELECT COUNT(*) FROM gold_cn_screen_results").fetchone()[0] == len(snapshot)
+        latest = conn.execute("SELECT MAX(trade_date) FROM gold_cn_features").fetchone()[0]
+        valid_from = conn.execute("SELECT valid_from FROM security_master WHERE ticker='300001.SZ'").fetchone()[0]
+    assert latest == scored["date"].max().date().isoformat()
+    assert valid_from == scored["date"].min().date().isoformat()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import sys
+import types
 from datetime import date, datetime
 
 import pandas as pd
 import pytest
 
 from quant_agent.cli.run_reversal_screen import validate_temporal_run_mode
-from quant_agent.data_sources.sina_market import prefilter_repair_universe
+from quant_agent.data_sources.sina_market import fetch_sina_histories, normalize_sina_spot, prefilter_repair_universe
 from quant_agent.screening.reversal import build_reversal_features, classify_market_repair, publish_reversal_screen, score_reversal_features
 
 
@@ -116,3 +118,40 @@ def test_intraday_and_historical_spot_temporal_guards() -> None:
     with pytest.raises(RuntimeError, match="cannot be relabeled"):
         validate_temporal_run_mode(date(2026, 7, 23), now, preview=False, from_cache=False)
     validate_temporal_run_mode(date(2026, 7, 23), now, preview=False, from_cache=True)
+
+
+def test_sina_spot_keeps_only_shanghai_and_shenzhen_six_digit_codes() -> None:
+    raw = pd.DataFrame({
+        "代码": ["sz000001", "sh600000", "bj830799", "sh60000", None],
+        "名称": ["平安银行", "*ST测试", "北交所", "短码", "缺失"],
+        "最新价": 10.0, "昨收": 9.8, "今开": 9.9, "最高": 10.1, "最低": 9.7,
+        "成交量": 1_000, "成交额": 10_000.0, "时间戳": "15:00:00",
+    })
+    spot = normalize_sina_spot(raw, date(2026, 7, 14))
+    assert spot["ticker"].tolist() == ["000001.SZ", "600000.SH"]
+    assert spot["is_st"].tolist() == [False, True]
+
+
+def test_sina_spot_tolerates_duplicate_index_labels() -> None:
+    raw = pd.DataFrame({
+        "代码": ["sh600000", "bj830799", "sz000001"],
+        "名称": ["浦发银行", "北交所", "平安银行"],
+        "最新价": 10.0, "昨收": 9.8, "今开": 9.9, "最高": 10.1, "最低": 9.7,
+        "成交量": 1_000, "成交额": 10_000.0, "时间戳": "15:00:00",
+    }, index=[7, 7, 3])
+    spot = normalize_sina_spot(raw, date(2026, 7, 14))
+    assert spot[["ticker", "name"]].values.tolist() == [["000001.SZ", "平安银行"], ["600000.SH", "浦发银行"]]
+
+
+def test_malformed_history_candidate_is_reported_not_raised(monkeypatch) -> None:
+    as_of = date(2026, 7, 14)
+    history = pd.DataFrame({"date": ["2026-07-14"], "open": 9.9, "high": 10.1, "low": 9.7, "close": 10.0, "amount": 10})
+    fake_akshare = types.SimpleNamespace(stock_zh_a_hist_tx=lambda **_: history.copy())
+    monkeypatch.setitem(sys.modules, "akshare", fake_akshare)
+    candidates = pd.DataFrame({
+        "source_symbol": ["sz000001", "sh600000"], "ticker": ["000001.SZ", "600000.SH"], "name": ["平安银行", "浦发银行"],
+        "amount_rank_market": [1.0, "bad"], "open": 9.9, "high": 10.1, "low": 9.7, "close": 10.0, "volume": 1_000.0, "amount": 10_000.0,
+    })
+    histories, errors = fetch_sina_histories(candidates, as_of, workers=2, retries=0)
+    assert histories["ticker"].unique().tolist() == ["000001.SZ"]
+    assert errors == [{"ticker": "600000.SH", "error_type": "ValueError"}]
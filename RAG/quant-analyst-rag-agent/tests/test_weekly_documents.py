@@ -62,3 +62,12 @@ def test_existing_store_only_rebuilds_current_and_previous_week(tmp_path) -> Non
     publish_weekly_documents(db_path, documents, chunks, tmp_path / "out")
 
     assert weekly_incremental_start(db_path, "2026-07-15").isoformat() == "2026-07-06"
+
+
+def test_stall_flag_marks_state_change_as_distribution_risk() -> None:
+    scored = _scored()
+    scored.loc[(scored["ticker"] == "300308.SZ") & (scored["date"] == pd.Timestamp("2026-07-09")), "high_volume_stall_flag"] = True
+    documents, _ = build_weekly_documents(scored, "2026-07-10")
+
+    assert "BREAKOUT_CANDIDATE -> DISTRIBUTION_RISK" in documents[0].content
+    assert "DISTRIBUTION_RISK -> BREAKOUT_CANDIDATE" in documents[0].content